@@ -3,9 +3,8 @@
 use crate::core::database::Database;
 use crate::models::input::{KeyEventType, KeyboardEvent, KeyboardShortcut, ModifierState};
 use serde::{Deserialize, Serialize};
-use std::collections::{HashMap, VecDeque};
-use std::sync::Arc;
-use std::time::Duration;
+use std::collections::HashMap;
+use std::sync::{Arc, OnceLock};
 use uuid::Uuid;
 
 // ==============================================================================
@@ -612,6 +611,15 @@ impl CommandDatabase {
         Self { shortcuts }
     }
 
+    /// Shared, lazily built database of known shortcuts
+    ///
+    /// The table is static per platform, so it is built once per process
+    /// instead of every time an analyzer is created.
+    pub fn global() -> &'static CommandDatabase {
+        static DATABASE: OnceLock<CommandDatabase> = OnceLock::new();
+        DATABASE.get_or_init(CommandDatabase::new)
+    }
+
     pub fn lookup(&self, shortcut: &KeyboardShortcut) -> Option<&CommandDefinition> {
         let key = self.shortcut_to_key(shortcut);
         self.shortcuts.get(&key)
@@ -645,17 +653,13 @@ impl CommandDatabase {
 // ==============================================================================
 
 pub struct CommandAnalyzer {
-    command_database: CommandDatabase,
-    keyboard_buffer: VecDeque<KeyboardEvent>,
-    buffer_duration: Duration,
+    command_database: &'static CommandDatabase,
 }
 
 impl CommandAnalyzer {
     pub fn new() -> Self {
         Self {
-            command_database: CommandDatabase::new(),
-            keyboard_buffer: VecDeque::new(),
-            buffer_duration: Duration::from_millis(500),
+            command_database: CommandDatabase::global(),
         }
     }
 
@@ -668,12 +672,6 @@ impl CommandAnalyzer {
                 continue;
             }
 
-            // Add to buffer
-            self.keyboard_buffer.push_back(event.clone());
-
-            // Remove old events from buffer
-            self.clean_buffer();
-
             // Check if this forms a command
             if let Some(command) = self.detect_command(&event) {
                 commands.push(command);
@@ -683,18 +681,6 @@ impl CommandAnalyzer {
         commands
     }
 
-    fn clean_buffer(&mut self) {
-        let now = chrono::Utc::now().timestamp_millis();
-
-        while let Some(front) = self.keyboard_buffer.front() {
-            if now - front.timestamp > self.buffer_duration.as_millis() as i64 {
-                self.keyboard_buffer.pop_front();
-            } else {
-                break;
-            }
-        }
-    }
-
     fn detect_command(&self, event: &KeyboardEvent) -> Option<Command> {
         // Check if event has modifiers (likely a command)
         if !self.has_any_modifier(&event.modifiers) {
@@ -63,6 +63,7 @@ impl FFmpegEncoder {
     /// * `fps` - Frames per second
     /// * `codec_name` - FFmpeg codec name (e.g., "h264_videotoolbox", "libx264")
     /// * `crf` - Constant Rate Factor for quality (lower = better quality)
+    /// * `pixel_format` - Layout of the frames that will be passed to `encode_frame`
     pub fn new(
         output_path: &Path,
         width: u32,
@@ -70,6 +71,7 @@ impl FFmpegEncoder {
         fps: u32,
         codec_name: &str,
         crf: u32,
+        pixel_format: PixelFormat,
     ) -> Result<Self> {
         unsafe {
             // Convert output path to C string
@@ -105,6 +107,9 @@ impl FFmpegEncoder {
             (*codec_context).pix_fmt = AVPixelFormat::AV_PIX_FMT_YUV420P;
             (*codec_context).gop_size = fps as i32 * 2; // Keyframe every 2 seconds
             (*codec_context).max_b_frames = 2;
+            // 0 = let the codec pick a thread count from the available cores;
+            // the default of 1 leaves software encoding single-threaded
+            (*codec_context).thread_count = 0;
 
             // Set CRF for quality control (H.264 specific)
             let crf_str = CString::new(crf.to_string()).unwrap();
@@ -225,11 +230,13 @@ impl FFmpegEncoder {
                 return Err(FFmpegError::PacketAllocation);
             }
 
-            // Initialize swscale context for RGBA -> YUV420P conversion
+            // Initialize swscale context for capture format -> YUV420P conversion.
+            // Feeding the native capture layout lets swscale do the swizzle in
+            // the same pass instead of needing a separate BGRA -> RGBA copy.
             let sws_context = sws_getContext(
                 width as i32,
                 height as i32,
-                AVPixelFormat::AV_PIX_FMT_RGBA,
+                Self::source_pixel_format(pixel_format),
                 width as i32,
                 height as i32,
                 AVPixelFormat::AV_PIX_FMT_YUV420P,
@@ -260,6 +267,14 @@ impl FFmpegEncoder {
         }
     }
 
+    /// Map a capture pixel format to the matching FFmpeg source format
+    fn source_pixel_format(pixel_format: PixelFormat) -> AVPixelFormat {
+        match pixel_format {
+            PixelFormat::RGBA8 => AVPixelFormat::AV_PIX_FMT_RGBA,
+            PixelFormat::BGRA8 => AVPixelFormat::AV_PIX_FMT_BGRA,
+        }
+    }
+
     /// Encode a single frame
     pub fn encode_frame(&mut self, raw_frame: &RawFrame) -> Result<()> {
         unsafe {
@@ -269,7 +284,7 @@ impl FFmpegEncoder {
                 return Err(FFmpegError::EncodingError("Failed to make frame writable".to_string()));
             }
 
-            // Convert RGBA to YUV420P
+            // Convert RGBA/BGRA to YUV420P
             let src_data = [
                 raw_frame.data.as_ptr() as *const u8,
                 ptr::null(),
@@ -277,7 +292,7 @@ impl FFmpegEncoder {
                 ptr::null(),
             ];
             let src_linesize = [
-                (raw_frame.width * 4) as i32, // RGBA has 4 bytes per pixel
+                (raw_frame.width * 4) as i32, // RGBA/BGRA have 4 bytes per pixel
                 0,
                 0,
                 0,
@@ -429,6 +444,7 @@ mod tests {
             30,
             "libx264",
             23,
+            PixelFormat::BGRA8,
         );
 
         assert!(result.is_ok());
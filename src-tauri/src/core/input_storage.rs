@@ -1,10 +1,16 @@
 use crate::core::database::Database;
 use crate::models::input::{KeyboardEvent, MouseEvent};
 use serde::{Deserialize, Serialize};
+use sqlx::{QueryBuilder, Sqlite};
 use std::sync::Arc;
 use tokio::sync::RwLock;
 use uuid::Uuid;
 
+/// Conservative bind parameter limit per statement (SQLite's historical default)
+const MAX_BIND_PARAMS: usize = 999;
+const KEYBOARD_EVENT_COLUMNS: usize = 11;
+const MOUSE_EVENT_COLUMNS: usize = 10;
+
 // ==============================================================================
 // Time Range for Queries
 // ==============================================================================
@@ -219,40 +225,49 @@ impl InputStorage {
             return Ok(());
         }
 
+        let rows = buffer
+            .drain(..)
+            .map(|(session_id, event)| {
+                let modifiers_json = serde_json::to_string(&event.modifiers)?;
+                let ui_element_json = event
+                    .ui_element
+                    .as_ref()
+                    .map(|e| serde_json::to_string(e))
+                    .transpose()?;
+                Ok((session_id, event, modifiers_json, ui_element_json))
+            })
+            .collect::<Result<Vec<_>, serde_json::Error>>()?;
+
         let pool = self.db.pool();
 
         // Begin transaction for batch insert
         let mut tx = pool.begin().await?;
 
-        for (session_id, event) in buffer.drain(..) {
-            let modifiers_json = serde_json::to_string(&event.modifiers)?;
-            let ui_element_json = event
-                .ui_element
-                .as_ref()
-                .map(|e| serde_json::to_string(e))
-                .transpose()?;
-
-            sqlx::query(
+        // One multi-row INSERT per chunk instead of one statement per event
+        for chunk in rows.chunks(MAX_BIND_PARAMS / KEYBOARD_EVENT_COLUMNS) {
+            let mut query = QueryBuilder::<Sqlite>::new(
                 r#"
                 INSERT INTO keyboard_events (
                     id, session_id, timestamp, event_type, key_code, key_char,
                     modifiers, app_name, window_title, process_id, ui_element
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                "#,
-            )
-            .bind(Uuid::new_v4().to_string())
-            .bind(session_id)
-            .bind(event.timestamp)
-            .bind(event.event_type.to_string())
-            .bind(event.key_code as i64)
-            .bind(event.key_char.map(|c| c.to_string()))
-            .bind(modifiers_json)
-            .bind(event.app_context.app_name)
-            .bind(event.app_context.window_title)
-            .bind(event.app_context.process_id as i64)
-            .bind(ui_element_json)
-            .execute(&mut *tx)
-            .await?;
+                ) "#,
+            );
+
+            query.push_values(chunk, |mut row, (session_id, event, modifiers_json, ui_element_json)| {
+                row.push_bind(Uuid::new_v4().to_string())
+                    .push_bind(session_id.as_str())
+                    .push_bind(event.timestamp)
+                    .push_bind(event.event_type.to_string())
+                    .push_bind(event.key_code as i64)
+                    .push_bind(event.key_char.map(|c| c.to_string()))
+                    .push_bind(modifiers_json.as_str())
+                    .push_bind(event.app_context.app_name.as_str())
+                    .push_bind(event.app_context.window_title.as_str())
+                    .push_bind(event.app_context.process_id as i64)
+                    .push_bind(ui_element_json.as_deref());
+            });
+
+            query.build().execute(&mut *tx).await?;
         }
 
         tx.commit().await?;
@@ -287,38 +302,47 @@ impl InputStorage {
             return Ok(());
         }
 
+        let rows = buffer
+            .drain(..)
+            .map(|(session_id, event)| {
+                let ui_element_json = event
+                    .ui_element
+                    .as_ref()
+                    .map(|e| serde_json::to_string(e))
+                    .transpose()?;
+                Ok((session_id, event, ui_element_json))
+            })
+            .collect::<Result<Vec<_>, serde_json::Error>>()?;
+
         let pool = self.db.pool();
 
         // Begin transaction for batch insert
         let mut tx = pool.begin().await?;
 
-        for (session_id, event) in buffer.drain(..) {
-            let ui_element_json = event
-                .ui_element
-                .as_ref()
-                .map(|e| serde_json::to_string(e))
-                .transpose()?;
-
-            sqlx::query(
+        // One multi-row INSERT per chunk instead of one statement per event
+        for chunk in rows.chunks(MAX_BIND_PARAMS / MOUSE_EVENT_COLUMNS) {
+            let mut query = QueryBuilder::<Sqlite>::new(
                 r#"
                 INSERT INTO mouse_events (
                     id, session_id, timestamp, event_type,
                     position_x, position_y, app_name, window_title, process_id, ui_element
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                "#,
-            )
-            .bind(Uuid::new_v4().to_string())
-            .bind(session_id)
-            .bind(event.timestamp)
-            .bind(event.event_type.to_string())
-            .bind(event.position.x as i64)
-            .bind(event.position.y as i64)
-            .bind(event.app_context.app_name)
-            .bind(event.app_context.window_title)
-            .bind(event.app_context.process_id as i64)
-            .bind(ui_element_json)
-            .execute(&mut *tx)
-            .await?;
+                ) "#,
+            );
+
+            query.push_values(chunk, |mut row, (session_id, event, ui_element_json)| {
+                row.push_bind(Uuid::new_v4().to_string())
+                    .push_bind(session_id.as_str())
+                    .push_bind(event.timestamp)
+                    .push_bind(event.event_type.to_string())
+                    .push_bind(event.position.x as i64)
+                    .push_bind(event.position.y as i64)
+                    .push_bind(event.app_context.app_name.as_str())
+                    .push_bind(event.app_context.window_title.as_str())
+                    .push_bind(event.app_context.process_id as i64)
+                    .push_bind(ui_element_json.as_deref());
+            });
+
+            query.build().execute(&mut *tx).await?;
         }
 
         tx.commit().await?;
@@ -424,8 +448,11 @@ impl InputStorage {
         &self,
         session_id: String,
     ) -> Result<InputTimeline, Box<dyn std::error::Error + Send + Sync>> {
-        let keyboard_events = self.get_keyboard_events(session_id.clone(), None).await?;
-        let mouse_events = self.get_mouse_events(session_id, None).await?;
+        // Independent reads; run them concurrently on separate pool connections
+        let (keyboard_events, mouse_events) = tokio::try_join!(
+            self.get_keyboard_events(session_id.clone(), None),
+            self.get_mouse_events(session_id, None),
+        )?;
 
         Ok(InputTimeline {
             keyboard_events,
@@ -537,3 +564,88 @@ impl InputStorage {
         Ok(())
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::models::input::{AppContext, KeyEventType, ModifierState, UiElement};
+    use sqlx::sqlite::SqlitePoolOptions;
+
+    const TEST_SESSION_ID: &str = "test-session";
+
+    async fn setup_test_storage() -> InputStorage {
+        // Use in-memory database for tests
+        let pool = SqlitePoolOptions::new()
+            .max_connections(1)
+            .connect("sqlite::memory:")
+            .await
+            .expect("Failed to create in-memory database");
+
+        let db = Database { pool };
+        db.run_migrations().await.expect("Failed to run migrations");
+
+        // Events reference their session through a foreign key
+        db.create_session(TEST_SESSION_ID, chrono::Utc::now().timestamp(), "test-device")
+            .await
+            .expect("Failed to create session");
+
+        InputStorage::new(Arc::new(db))
+            .await
+            .expect("Failed to create input storage")
+    }
+
+    fn create_test_keyboard_event(timestamp: i64, with_ui_element: bool) -> KeyboardEvent {
+        KeyboardEvent {
+            timestamp,
+            event_type: KeyEventType::KeyDown,
+            key_code: 65,
+            key_char: Some('a'),
+            modifiers: ModifierState::new(),
+            app_context: AppContext::new("Editor".to_string(), "notes.txt".to_string(), 42),
+            ui_element: with_ui_element.then(|| {
+                UiElement::new("TextField".to_string(), Some("Body".to_string()), "textbox".to_string())
+            }),
+            is_sensitive: false,
+        }
+    }
+
+    #[tokio::test]
+    async fn test_flush_keyboard_buffer_across_chunks() {
+        let storage = setup_test_storage().await;
+
+        // More events than fit in one multi-row INSERT, alternating ui_element
+        let rows_per_insert = MAX_BIND_PARAMS / KEYBOARD_EVENT_COLUMNS;
+        let event_count = rows_per_insert * 2 + 10;
+        {
+            let mut buffer = storage.keyboard_buffer.write().await;
+            for i in 0..event_count as i64 {
+                buffer.push((TEST_SESSION_ID.to_string(), create_test_keyboard_event(i, i % 2 == 1)));
+            }
+        }
+
+        storage.flush_keyboard_buffer().await.expect("Failed to flush keyboard buffer");
+        assert!(storage.keyboard_buffer.read().await.is_empty());
+
+        let rows: Vec<(i64, String, Option<String>)> = sqlx::query_as(
+            "SELECT timestamp, session_id, ui_element FROM keyboard_events ORDER BY timestamp",
+        )
+        .fetch_all(storage.db.pool())
+        .await
+        .expect("Failed to read keyboard events");
+
+        assert_eq!(rows.len(), event_count);
+        for (i, (timestamp, session_id, ui_element)) in rows.into_iter().enumerate() {
+            assert_eq!(timestamp, i as i64);
+            assert_eq!(session_id, TEST_SESSION_ID);
+
+            if i % 2 == 1 {
+                let element: UiElement = serde_json::from_str(&ui_element.expect("ui_element missing"))
+                    .expect("ui_element is not valid JSON");
+                assert_eq!(element.element_type, "TextField");
+                assert_eq!(element.label.as_deref(), Some("Body"));
+            } else {
+                assert!(ui_element.is_none(), "ui_element should be NULL at row {}", i);
+            }
+        }
+    }
+}
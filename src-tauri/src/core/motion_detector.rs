@@ -21,10 +21,14 @@ pub struct MotionResult {
 
 /// Motion detector that compares frames to detect changes
 pub struct MotionDetector {
-    previous_frame: Option<Vec<u8>>,
+    /// Pixels of the last frame seen; the allocation is reused across frames
+    previous_frame: Vec<u8>,
+    /// Dimensions of `previous_frame`, or None if no frame has been seen yet
     previous_dimensions: Option<(u32, u32)>,
     threshold: f32,
     pixel_diff_threshold: u8,
+    /// Whether to compute per-cell bounding boxes for frames with motion
+    compute_regions: bool,
 }
 
 impl MotionDetector {
@@ -35,20 +39,30 @@ impl MotionDetector {
     ///   e.g., 0.05 = 5% of pixels must change
     pub fn new(threshold: f32) -> Self {
         Self {
-            previous_frame: None,
+            previous_frame: Vec::new(),
             previous_dimensions: None,
             threshold,
             pixel_diff_threshold: 10, // RGB diff threshold per pixel
+            compute_regions: true,
         }
     }
 
+    /// Enable or disable bounding box calculation
+    ///
+    /// Callers that only need `has_motion` and `changed_percentage` can turn
+    /// this off to skip the second, per-cell pass over frames with motion;
+    /// motion results then carry no bounding boxes.
+    pub fn set_compute_regions(&mut self, enabled: bool) {
+        self.compute_regions = enabled;
+    }
+
     /// Detect motion by comparing current frame with previous
     pub fn detect_motion(&mut self, current_frame: &RawFrame) -> MotionResult {
         let current_dims = (current_frame.width, current_frame.height);
 
         // First frame or dimension change - always has "motion"
-        if self.previous_frame.is_none() || self.previous_dimensions != Some(current_dims) {
-            self.previous_frame = Some(current_frame.data.clone());
+        if self.previous_dimensions != Some(current_dims) {
+            self.previous_frame.clone_from(&current_frame.data);
             self.previous_dimensions = Some(current_dims);
 
             return MotionResult {
@@ -63,18 +77,17 @@ impl MotionDetector {
             };
         }
 
-        let previous_data = self.previous_frame.as_ref().unwrap();
-        let changed_pixels = self.count_changed_pixels(previous_data, &current_frame.data);
+        let changed_pixels = self.count_changed_pixels(&self.previous_frame, &current_frame.data);
 
         let total_pixels = (current_frame.width * current_frame.height) as usize;
         let changed_percentage = changed_pixels as f32 / total_pixels as f32;
 
         let has_motion = changed_percentage >= self.threshold;
 
-        // Calculate bounding boxes if there's motion
-        let bounding_boxes = if has_motion {
+        // Calculate bounding boxes if there's motion and the caller wants them
+        let bounding_boxes = if has_motion && self.compute_regions {
             self.calculate_bounding_boxes(
-                previous_data,
+                &self.previous_frame,
                 &current_frame.data,
                 current_frame.width,
                 current_frame.height,
@@ -83,8 +96,8 @@ impl MotionDetector {
             Vec::new()
         };
 
-        // Update previous frame
-        self.previous_frame = Some(current_frame.data.clone());
+        // Update previous frame in place rather than allocating a new buffer
+        self.previous_frame.clone_from(&current_frame.data);
 
         MotionResult {
             has_motion,
@@ -95,40 +108,30 @@ impl MotionDetector {
 
     /// Reset the detector (clears previous frame)
     pub fn reset(&mut self) {
-        self.previous_frame = None;
+        self.previous_frame.clear();
         self.previous_dimensions = None;
     }
 
     /// Count pixels that have changed between two frames
+    ///
+    /// Walks both buffers pixel by pixel without bounds checks or branches so
+    /// the compiler can auto-vectorize the comparison.
     fn count_changed_pixels(&self, previous: &[u8], current: &[u8]) -> usize {
-        let mut changed = 0;
-
-        for i in (0..previous.len()).step_by(4) {
-            if i + 3 < current.len() {
-                let prev_r = previous[i];
-                let prev_g = previous[i + 1];
-                let prev_b = previous[i + 2];
-
-                let curr_r = current[i];
-                let curr_g = current[i + 1];
-                let curr_b = current[i + 2];
-
-                // Calculate RGB difference
-                let diff_r = (prev_r as i16 - curr_r as i16).abs() as u8;
-                let diff_g = (prev_g as i16 - curr_g as i16).abs() as u8;
-                let diff_b = (prev_b as i16 - curr_b as i16).abs() as u8;
-
-                // If any channel differs significantly, count as changed
-                if diff_r > self.pixel_diff_threshold
-                    || diff_g > self.pixel_diff_threshold
-                    || diff_b > self.pixel_diff_threshold
-                {
-                    changed += 1;
-                }
-            }
-        }
+        previous
+            .chunks_exact(4)
+            .zip(current.chunks_exact(4))
+            .map(|(prev, curr)| self.pixel_changed(prev, curr) as usize)
+            .sum()
+    }
 
-        changed
+    /// Whether any color channel of a pixel differs by more than the threshold
+    #[inline]
+    fn pixel_changed(&self, prev: &[u8], curr: &[u8]) -> bool {
+        let diff = prev[0]
+            .abs_diff(curr[0])
+            .max(prev[1].abs_diff(curr[1]))
+            .max(prev[2].abs_diff(curr[2]));
+        diff > self.pixel_diff_threshold
     }
 
     /// Calculate bounding boxes for regions with motion
@@ -334,4 +337,20 @@ mod tests {
             "Insensitive detector should not detect small motion"
         );
     }
+
+    #[test]
+    fn test_regions_disabled() {
+        let mut detector = MotionDetector::new(0.05);
+        detector.set_compute_regions(false);
+
+        let frame1 = create_test_frame(100, 100, [0, 0, 0, 255]);
+        let frame2 = create_test_frame(100, 100, [255, 255, 255, 255]);
+
+        detector.detect_motion(&frame1);
+        let result = detector.detect_motion(&frame2);
+
+        assert!(result.has_motion);
+        assert_eq!(result.changed_percentage, 1.0);
+        assert!(result.bounding_boxes.is_empty());
+    }
 }
@@ -10,7 +10,8 @@ use crate::platform::power::{PowerEvent, PowerManager};
 use async_trait::async_trait;
 use serde::{Deserialize, Serialize};
 use std::sync::Arc;
-use tokio::sync::{Mutex, RwLock};
+use tokio::sync::{mpsc, Mutex, RwLock};
+use tokio::task::JoinHandle;
 use tokio::time::{Duration, Instant};
 use uuid::Uuid;
 
@@ -34,6 +35,9 @@ pub trait ScreenCapture: Send + Sync {
 
     /// Get the current display being captured
     fn current_display_id(&self) -> Option<u32>;
+
+    /// Release any display server connection held open between captures
+    fn release_connection(&self) {}
 }
 
 /// Wrapper for platform-specific capture implementation
@@ -66,6 +70,11 @@ impl ScreenCapture for PlatformCaptureWrapper {
     fn current_display_id(&self) -> Option<u32> {
         self.inner.current_display_id()
     }
+
+    #[cfg(target_os = "linux")]
+    fn release_connection(&self) {
+        PlatformCapture::close_capture_connection();
+    }
 }
 
 /// Factory function to create platform-specific screen capture
@@ -92,6 +101,8 @@ pub struct RecordingStatus {
 pub struct RecordingConfig {
     pub target_fps: u32,
     pub buffer_size: usize,
+    /// Encode early once buffered raw frames reach this many bytes
+    pub max_buffer_bytes: usize,
     pub no_motion_threshold: usize,
     pub motion_detection_threshold: f32,
     pub codec: VideoCodec,
@@ -104,6 +115,7 @@ impl Default for RecordingConfig {
         Self {
             target_fps: 10,
             buffer_size: 60,          // 6 seconds at 10fps
+            max_buffer_bytes: 512 * 1024 * 1024, // ~15 frames at 4K BGRA
             no_motion_threshold: 20,  // ~2 seconds at 10fps
             motion_detection_threshold: 0.05, // 5% pixels changed
             codec: VideoCodec::H264,
@@ -113,14 +125,28 @@ impl Default for RecordingConfig {
     }
 }
 
+/// Segments queued for encoding beyond the one being encoded. Kept small so
+/// a slow encoder applies backpressure instead of piling up raw frames.
+const ENCODE_QUEUE_DEPTH: usize = 1;
+
+/// A full frame buffer waiting to be encoded into a segment
+struct SegmentJob {
+    frames: Vec<RawFrame>,
+    segment_num: usize,
+}
+
 /// Recording state
 struct RecordingState {
     session_id: Uuid,
     display_id: u32,
+    /// Resolved once at start so status polls don't re-enumerate displays
+    display_name: String,
     motion_detector: MotionDetector,
-    video_encoder: VideoEncoder,
+    encoder_task: Option<JoinHandle<()>>,
     frame_buffer: Vec<RawFrame>,
-    base_layer: Option<RawFrame>,
+    buffered_bytes: usize,
+    /// Shared so saving it to disk doesn't copy the frame again
+    base_layer: Option<Arc<RawFrame>>,
     no_motion_count: usize,
     total_frames: usize,
     motion_frames: usize,
@@ -232,19 +258,24 @@ impl ScreenRecorder {
             .map_err(|e| CaptureError::CaptureFailed(format!("Failed to create session: {}", e)))?;
 
         // Initialize recording state
-        let motion_detector = MotionDetector::new(self.config.motion_detection_threshold);
+        let mut motion_detector = MotionDetector::new(self.config.motion_detection_threshold);
+        // Only the motion verdict and changed percentage drive recording
+        motion_detector.set_compute_regions(false);
         let video_encoder = VideoEncoder::new(
             self.config.codec,
             self.config.quality,
             self.config.hardware_acceleration,
         ).map_err(|e| CaptureError::CaptureFailed(format!("Failed to create encoder: {}", e)))?;
+        let (segment_sender, encoder_task) = self.spawn_segment_encoder(session_id, video_encoder);
 
         let recording_state = RecordingState {
             session_id,
             display_id,
+            display_name: display.name.clone(),
             motion_detector,
-            video_encoder,
+            encoder_task: Some(encoder_task),
             frame_buffer: Vec::with_capacity(self.config.buffer_size),
+            buffered_bytes: 0,
             base_layer: None,
             no_motion_count: 0,
             total_frames: 0,
@@ -263,7 +294,9 @@ impl ScreenRecorder {
         // Start recording loop in background
         let recorder = Arc::new(self.clone_for_recording());
         tokio::spawn(async move {
-            if let Err(e) = recorder.recording_loop().await {
+            // The loop owns the only segment sender, so the encoder task sees
+            // its queue close however the loop exits, even on panic or abort
+            if let Err(e) = recorder.recording_loop(segment_sender).await {
                 eprintln!("Recording loop error: {}", e);
             }
         });
@@ -279,12 +312,22 @@ impl ScreenRecorder {
         // Wait for recording loop to stop
         tokio::time::sleep(Duration::from_millis(500)).await;
 
-        // Get session ID before clearing state
-        let session_id = {
-            let state = self.state.read().await;
-            state.as_ref().map(|s| s.session_id)
+        // Get session ID and encoder task before clearing state
+        let (session_id, encoder_task) = {
+            let mut state = self.state.write().await;
+            match state.as_mut() {
+                Some(s) => (Some(s.session_id), s.encoder_task.take()),
+                None => (None, None),
+            }
         };
 
+        // Wait for queued segments to finish encoding before ending the session
+        if let Some(encoder_task) = encoder_task {
+            if let Err(e) = encoder_task.await {
+                eprintln!("Segment encoder task failed: {}", e);
+            }
+        }
+
         if let Some(session_id) = session_id {
             // End the session
             self.storage.end_session(session_id).await
@@ -296,6 +339,9 @@ impl ScreenRecorder {
         // Clear state
         *self.state.write().await = None;
 
+        // Don't keep the capture connection open while not recording
+        self.capture.lock().await.release_connection();
+
         Ok(())
     }
 
@@ -337,7 +383,10 @@ impl ScreenRecorder {
     }
 
     /// Main recording loop - runs continuously until stopped
-    async fn recording_loop(&self) -> CaptureResult<()> {
+    ///
+    /// Full frame buffers are queued on `segment_sender`; dropping it when the
+    /// loop ends lets the encoder task drain the queue and exit.
+    async fn recording_loop(&self, segment_sender: mpsc::Sender<SegmentJob>) -> CaptureResult<()> {
         let frame_interval = Duration::from_millis(1000 / self.config.target_fps as u64);
         let mut last_frame_time = Instant::now();
         let mut power_events = self.power_manager.subscribe();
@@ -346,7 +395,7 @@ impl ScreenRecorder {
             // Check stop signal
             if *self.stop_signal.read().await {
                 // Encode any remaining frames
-                self.flush_buffer().await?;
+                self.flush_buffer(&segment_sender).await?;
                 break;
             }
 
@@ -383,7 +432,7 @@ impl ScreenRecorder {
             last_frame_time = Instant::now();
 
             // Process one frame
-            if let Err(e) = self.process_frame().await {
+            if let Err(e) = self.process_frame(&segment_sender).await {
                 eprintln!("Frame processing error: {}", e);
             }
         }
@@ -392,7 +441,7 @@ impl ScreenRecorder {
     }
 
     /// Process a single frame
-    async fn process_frame(&self) -> CaptureResult<()> {
+    async fn process_frame(&self, segment_sender: &mpsc::Sender<SegmentJob>) -> CaptureResult<()> {
         let display_id = {
             let state = self.state.read().await;
             let s = state.as_ref().ok_or(CaptureError::NotCapturing)?;
@@ -414,16 +463,21 @@ impl ScreenRecorder {
 
         // Handle based on motion
         if motion.has_motion {
-            self.handle_motion_frame(frame, motion).await?;
+            self.handle_motion_frame(frame, motion, segment_sender).await?;
         } else {
-            self.handle_static_frame(frame).await?;
+            self.handle_static_frame(frame, segment_sender).await?;
         }
 
         Ok(())
     }
 
     /// Handle a frame with motion detected
-    async fn handle_motion_frame(&self, frame: RawFrame, motion: MotionResult) -> CaptureResult<()> {
+    async fn handle_motion_frame(
+        &self,
+        frame: RawFrame,
+        motion: MotionResult,
+        segment_sender: &mpsc::Sender<SegmentJob>,
+    ) -> CaptureResult<()> {
         // Check if we need to update base layer and encode
         let (should_save_base, should_encode) = {
             let mut state = self.state.write().await;
@@ -431,12 +485,13 @@ impl ScreenRecorder {
 
             s.no_motion_count = 0;
             s.motion_frames += 1;
+            s.buffered_bytes += frame.data.len();
             s.frame_buffer.push(frame);
 
             // Check if major screen change (update base layer)
             let should_save_base = if motion.changed_percentage > 0.8 {
                 if let Some(last_frame) = s.frame_buffer.last() {
-                    s.base_layer = Some(last_frame.clone());
+                    s.base_layer = Some(Arc::new(last_frame.clone()));
                     true
                 } else {
                     false
@@ -445,8 +500,10 @@ impl ScreenRecorder {
                 false
             };
 
-            // Buffer full - encode segment
-            let should_encode = s.frame_buffer.len() >= self.config.buffer_size;
+            // Buffer full - encode segment. High resolution displays hit the
+            // byte cap well before the frame count, bounding peak memory.
+            let should_encode = s.frame_buffer.len() >= self.config.buffer_size
+                || s.buffered_bytes >= self.config.max_buffer_bytes;
 
             (should_save_base, should_encode)
         };
@@ -460,14 +517,18 @@ impl ScreenRecorder {
 
         // Encode buffer if needed (outside lock)
         if should_encode {
-            self.encode_and_save_buffer().await?;
+            self.encode_and_save_buffer(segment_sender).await?;
         }
 
         Ok(())
     }
 
     /// Handle a frame without motion
-    async fn handle_static_frame(&self, frame: RawFrame) -> CaptureResult<()> {
+    async fn handle_static_frame(
+        &self,
+        frame: RawFrame,
+        segment_sender: &mpsc::Sender<SegmentJob>,
+    ) -> CaptureResult<()> {
         let should_encode = {
             let mut state = self.state.write().await;
             let s = state.as_mut().ok_or(CaptureError::NotCapturing)?;
@@ -479,7 +540,7 @@ impl ScreenRecorder {
         };
 
         if should_encode {
-            self.encode_and_save_buffer().await?;
+            self.encode_and_save_buffer(segment_sender).await?;
         }
 
         // Update base layer periodically during static periods
@@ -492,7 +553,7 @@ impl ScreenRecorder {
         if should_update_base {
             let mut state = self.state.write().await;
             let s = state.as_mut().ok_or(CaptureError::NotCapturing)?;
-            s.base_layer = Some(frame);
+            s.base_layer = Some(Arc::new(frame));
             drop(state);
 
             self.save_base_layer().await?;
@@ -501,9 +562,12 @@ impl ScreenRecorder {
         Ok(())
     }
 
-    /// Encode buffered frames and save segment
-    async fn encode_and_save_buffer(&self) -> CaptureResult<()> {
-        let (frames, session_id, segment_num) = {
+    /// Hand buffered frames to the segment encoder
+    ///
+    /// Encoding runs on its own task so capture keeps its frame rate while a
+    /// segment is being encoded. Blocks only when the encoder queue is full.
+    async fn encode_and_save_buffer(&self, segment_sender: &mpsc::Sender<SegmentJob>) -> CaptureResult<()> {
+        let job = {
             let mut state = self.state.write().await;
             let s = state.as_mut().ok_or(CaptureError::NotCapturing)?;
 
@@ -512,47 +576,85 @@ impl ScreenRecorder {
             }
 
             let frames = s.frame_buffer.drain(..).collect::<Vec<_>>();
+            s.buffered_bytes = 0;
             s.segment_count += 1;
-            (frames, s.session_id, s.segment_count)
+            SegmentJob {
+                frames,
+                segment_num: s.segment_count,
+            }
         };
 
+        segment_sender
+            .send(job)
+            .await
+            .map_err(|_| CaptureError::CaptureFailed("Segment encoder stopped".to_string()))?;
+
+        Ok(())
+    }
+
+    /// Spawn the task that encodes and saves segments for a session
+    fn spawn_segment_encoder(
+        &self,
+        session_id: Uuid,
+        video_encoder: VideoEncoder,
+    ) -> (mpsc::Sender<SegmentJob>, JoinHandle<()>) {
+        let (sender, mut receiver) = mpsc::channel::<SegmentJob>(ENCODE_QUEUE_DEPTH);
+        let storage = Arc::clone(&self.storage);
+        let fps = self.config.target_fps;
+
+        let task = tokio::spawn(async move {
+            while let Some(job) = receiver.recv().await {
+                if let Err(e) =
+                    Self::encode_segment(&video_encoder, &storage, session_id, job, fps).await
+                {
+                    eprintln!("Segment encoding error: {}", e);
+                }
+            }
+        });
+
+        (sender, task)
+    }
+
+    /// Encode one segment and save it to the database
+    async fn encode_segment(
+        video_encoder: &VideoEncoder,
+        storage: &RecordingStorage,
+        session_id: Uuid,
+        job: SegmentJob,
+        fps: u32,
+    ) -> CaptureResult<()> {
         // Get output path
-        let output_path = self.storage.get_segment_path(&session_id, segment_num);
+        let output_path = storage.get_segment_path(&session_id, job.segment_num);
 
         // Encode frames
-        let segment = {
-            let state = self.state.read().await;
-            let s = state.as_ref().ok_or(CaptureError::NotCapturing)?;
-
-            s.video_encoder
-                .encode_frames(frames, output_path, self.config.target_fps)
-                .await
-                .map_err(|e| CaptureError::CaptureFailed(format!("Encoding failed: {}", e)))?
-        };
+        let segment = video_encoder
+            .encode_frames(job.frames, output_path, fps)
+            .await
+            .map_err(|e| CaptureError::CaptureFailed(format!("Encoding failed: {}", e)))?;
 
         // Save segment to database
-        self.storage
+        storage
             .save_segment(&session_id, &segment)
             .await
             .map_err(|e| CaptureError::CaptureFailed(format!("Failed to save segment: {}", e)))?;
 
         println!(
             "Encoded segment {}: {} frames, {} bytes",
-            segment_num, segment.frame_count, segment.file_size_bytes
+            job.segment_num, segment.frame_count, segment.file_size_bytes
         );
 
         Ok(())
     }
 
     /// Flush any remaining frames in buffer
-    async fn flush_buffer(&self) -> CaptureResult<()> {
+    async fn flush_buffer(&self, segment_sender: &mpsc::Sender<SegmentJob>) -> CaptureResult<()> {
         let has_frames = {
             let state = self.state.read().await;
             state.as_ref().map(|s| !s.frame_buffer.is_empty()).unwrap_or(false)
         };
 
         if has_frames {
-            self.encode_and_save_buffer().await?;
+            self.encode_and_save_buffer(segment_sender).await?;
         }
 
         Ok(())
@@ -563,7 +665,7 @@ impl ScreenRecorder {
         let (session_id, base_layer) = {
             let state = self.state.read().await;
             let s = state.as_ref().ok_or(CaptureError::NotCapturing)?;
-            (s.session_id, s.base_layer.clone())
+            (s.session_id, s.base_layer.as_ref().map(Arc::clone))
         };
 
         if let Some(frame) = base_layer {
@@ -590,11 +692,7 @@ impl ScreenRecorder {
 
         if let Some(ref s) = *state {
             let display_id = Some(s.display_id);
-            let displays = self.get_available_displays().await?;
-            let display_name = displays
-                .iter()
-                .find(|d| d.id == s.display_id)
-                .map(|d| d.name.clone());
+            let display_name = Some(s.display_name.clone());
 
             let total_motion_percentage = if s.total_frames > 0 {
                 (s.motion_frames as f32 / s.total_frames as f32) * 100.0
@@ -848,4 +946,125 @@ mod tests {
         // Cleanup
         let _ = std::fs::remove_dir_all(&temp_dir);
     }
+
+    /// Capture source that alternates between two solid frames, so every
+    /// frame after the first has motion
+    #[derive(Default)]
+    struct FlickerCapture {
+        frames_captured: std::sync::atomic::AtomicU32,
+    }
+
+    #[async_trait]
+    impl ScreenCapture for FlickerCapture {
+        async fn get_displays(&self) -> CaptureResult<Vec<Display>> {
+            Ok(vec![Display {
+                id: 1,
+                name: "Test Display".to_string(),
+                width: 64,
+                height: 64,
+                is_primary: true,
+            }])
+        }
+
+        async fn capture_frame(&self, _display_id: u32) -> CaptureResult<RawFrame> {
+            let count = self
+                .frames_captured
+                .fetch_add(1, std::sync::atomic::Ordering::SeqCst);
+            let value = if count % 2 == 0 { 0 } else { 255 };
+
+            Ok(RawFrame {
+                timestamp: chrono::Utc::now().timestamp_millis(),
+                width: 64,
+                height: 64,
+                data: vec![value; 64 * 64 * 4],
+                format: crate::models::capture::PixelFormat::BGRA8,
+            })
+        }
+
+        async fn start_capture(&mut self, _display_id: u32) -> CaptureResult<()> {
+            Ok(())
+        }
+
+        async fn stop_capture(&mut self) -> CaptureResult<()> {
+            Ok(())
+        }
+
+        fn is_capturing(&self) -> bool {
+            false
+        }
+
+        fn current_display_id(&self) -> Option<u32> {
+            None
+        }
+    }
+
+    #[tokio::test]
+    async fn test_stop_saves_queued_segment() {
+        let db = Arc::new(Database::init().await.expect("Failed to init database"));
+        let consent_manager = Arc::new(
+            ConsentManager::new(db.clone()).await.expect("Failed to create consent manager")
+        );
+        consent_manager
+            .grant_consent(Feature::ScreenRecording)
+            .await
+            .expect("Failed to grant consent");
+
+        let temp_dir = std::env::temp_dir().join("observer_test_stop_segment");
+        let storage = Arc::new(
+            RecordingStorage::new(temp_dir.clone(), db.clone())
+                .await
+                .expect("Failed to create storage")
+        );
+
+        // Never encode while recording, so the only segment is the one the
+        // loop queues when it flushes its buffer on stop
+        let config = RecordingConfig {
+            buffer_size: 10_000,
+            no_motion_threshold: 10_000,
+            hardware_acceleration: false,
+            ..RecordingConfig::default()
+        };
+        let capture: Box<dyn ScreenCapture> = Box::new(FlickerCapture::default());
+        let recorder = ScreenRecorder {
+            capture: Arc::new(Mutex::new(capture)),
+            consent_manager,
+            storage: storage.clone(),
+            config,
+            state: Arc::new(RwLock::new(None)),
+            stop_signal: Arc::new(RwLock::new(false)),
+            power_manager: Arc::new(PowerManager::new()),
+        };
+
+        recorder.start_recording(1).await.expect("Failed to start recording");
+        let session_id = recorder
+            .get_status()
+            .await
+            .expect("Failed to get status")
+            .session_id
+            .expect("Recording has no session");
+
+        tokio::time::sleep(Duration::from_millis(500)).await;
+        assert!(storage.get_session_segments(session_id).await.unwrap().is_empty());
+
+        // stop_recording must wait for the queued segment before ending the session
+        recorder.stop_recording().await.expect("Failed to stop");
+
+        let segments = storage
+            .get_session_segments(session_id)
+            .await
+            .expect("Failed to get segments");
+        assert_eq!(segments.len(), 1, "Segment queued at stop was not saved");
+        assert!(segments[0].frame_count > 0);
+
+        let end_timestamp: Option<i64> =
+            sqlx::query_scalar("SELECT end_timestamp FROM sessions WHERE id = ?")
+                .bind(session_id.to_string())
+                .fetch_one(db.pool())
+                .await
+                .expect("Failed to read session");
+        assert!(end_timestamp.is_some(), "Session was not ended");
+
+        // Cleanup
+        let _ = std::fs::remove_dir_all(&temp_dir);
+    }
 }
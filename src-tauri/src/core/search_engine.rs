@@ -155,13 +155,6 @@ impl SearchEngine {
             filter_clause
         );
 
-        let rows = sqlx::query_as::<_, SearchResultRow>(&sql)
-            .bind(&fts_query)
-            .bind(query.limit as i64)
-            .bind(query.offset as i64)
-            .fetch_all(self.db.pool())
-            .await?;
-
         // Get total count
         let count_sql = format!(
             r#"
@@ -174,15 +167,26 @@ impl SearchEngine {
             filter_clause
         );
 
-        let total_count: i64 = sqlx::query_scalar(&count_sql)
+        // The page and the total count are independent; run them concurrently
+        let rows_query = sqlx::query_as::<_, SearchResultRow>(&sql)
+            .bind(&fts_query)
+            .bind(query.limit as i64)
+            .bind(query.offset as i64)
+            .fetch_all(self.db.pool());
+
+        let count_query = sqlx::query_scalar::<_, i64>(&count_sql)
             .bind(&fts_query)
-            .fetch_one(self.db.pool())
-            .await?;
+            .fetch_one(self.db.pool());
+
+        let (rows, total_count) = tokio::try_join!(rows_query, count_query)?;
+
+        // Normalize the query once for snippet matching rather than per row
+        let snippet_query = self.normalize_snippet_query(&query.query);
 
         // Convert to SearchResult
         let search_results: Vec<SearchResult> = rows
             .into_iter()
-            .map(|row| self.row_to_search_result(row, &query.query))
+            .map(|row| self.row_to_search_result(row, &snippet_query))
             .collect::<Result<Vec<_>>>()?;
 
         let query_time = start_time.elapsed();
@@ -308,8 +312,10 @@ impl SearchEngine {
     }
 
     /// Convert database row to SearchResult
-    fn row_to_search_result(&self, row: SearchResultRow, query: &str) -> Result<SearchResult> {
-        let snippet = self.generate_snippet(&row.text, query, 100);
+    ///
+    /// `snippet_query` must already be normalized with `normalize_snippet_query`.
+    fn row_to_search_result(&self, row: SearchResultRow, snippet_query: &str) -> Result<SearchResult> {
+        let snippet = self.generate_snippet(&row.text, snippet_query, 100);
         let bounding_box: BoundingBox = serde_json::from_str(&row.bounding_box)?;
 
         Ok(SearchResult {
@@ -326,17 +332,20 @@ impl SearchEngine {
         })
     }
 
-    /// Generate text snippet highlighting the query
-    fn generate_snippet(&self, text: &str, query: &str, max_length: usize) -> String {
+    /// Strip FTS syntax from a user query and lowercase it for snippet matching
+    fn normalize_snippet_query(&self, query: &str) -> String {
         // Remove quotes from phrase queries
-        let query_clean = query.replace('"', "").replace('*', "");
-        let query_lower = query_clean.to_lowercase();
+        query.replace('"', "").replace('*', "").to_lowercase()
+    }
+
+    /// Generate text snippet highlighting the (normalized) query
+    fn generate_snippet(&self, text: &str, query_lower: &str, max_length: usize) -> String {
         let text_lower = text.to_lowercase();
 
-        if let Some(pos) = text_lower.find(&query_lower) {
+        if let Some(pos) = text_lower.find(query_lower) {
             // Extract snippet around query
             let start = pos.saturating_sub(max_length / 2);
-            let end = (pos + query_clean.len() + max_length / 2).min(text.len());
+            let end = (pos + query_lower.len() + max_length / 2).min(text.len());
             let mut snippet = text[start..end].to_string();
 
             // Add ellipsis if truncated
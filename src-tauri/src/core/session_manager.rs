@@ -1,6 +1,6 @@
 use crate::core::database::Database;
 use serde::{Deserialize, Serialize};
-use std::collections::{HashMap, HashSet};
+use std::collections::HashMap;
 use std::sync::Arc;
 use std::time::Duration;
 use tokio::sync::{mpsc, RwLock};
@@ -464,15 +464,12 @@ impl SessionManager {
 
         let app_switches = apps.len() as u32;
 
-        let unique_apps = apps
-            .iter()
-            .map(|a| &a.app_name)
-            .collect::<HashSet<_>>()
-            .len() as u32;
+        // Rows are already grouped by app name and sorted by focus time
+        // descending, so they are unique and the first one is the most used
+        let unique_apps = apps.len() as u32;
 
         let most_used_app = apps
-            .iter()
-            .max_by_key(|a| a.focus_duration_ms)
+            .first()
             .map(|a| a.app_name.clone())
             .unwrap_or_else(|| "None".to_string());
 
@@ -5,6 +5,7 @@ use crate::core::video_encoder::VideoSegment;
 use crate::models::capture::{PixelFormat, RawFrame};
 use image::{ImageBuffer, Rgba};
 use sqlx::Row;
+use std::borrow::Cow;
 use std::path::PathBuf;
 use std::sync::Arc;
 use thiserror::Error;
@@ -241,24 +242,22 @@ impl RecordingStorage {
 
     /// Save a RawFrame as PNG
     fn save_frame_as_png(&self, frame: &RawFrame, path: &PathBuf) -> StorageResult<()> {
-        // Convert to RGBA if needed
-        let rgba_data = match frame.format {
+        // Convert to RGBA if needed; RGBA frames are encoded straight from the
+        // frame buffer without a copy
+        let rgba_data: Cow<[u8]> = match frame.format {
             PixelFormat::BGRA8 => {
-                // Convert BGRA to RGBA
-                let mut rgba = Vec::with_capacity(frame.data.len());
-                for chunk in frame.data.chunks_exact(4) {
-                    rgba.push(chunk[2]); // R
-                    rgba.push(chunk[1]); // G
-                    rgba.push(chunk[0]); // B
-                    rgba.push(chunk[3]); // A
+                // Convert BGRA to RGBA: one bulk copy, then swap B and R in place
+                let mut rgba = frame.data.clone();
+                for pixel in rgba.chunks_exact_mut(4) {
+                    pixel.swap(0, 2);
                 }
-                rgba
+                Cow::Owned(rgba)
             }
-            PixelFormat::RGBA8 => frame.data.clone(),
+            PixelFormat::RGBA8 => Cow::Borrowed(&frame.data),
         };
 
-        let img: ImageBuffer<Rgba<u8>, Vec<u8>> =
-            ImageBuffer::from_raw(frame.width, frame.height, rgba_data)
+        let img: ImageBuffer<Rgba<u8>, &[u8]> =
+            ImageBuffer::from_raw(frame.width, frame.height, &rgba_data[..])
                 .ok_or_else(|| StorageError::Other("Failed to create image buffer".to_string()))?;
 
         img.save(path)?;
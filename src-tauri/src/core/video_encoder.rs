@@ -207,6 +207,7 @@ impl VideoEncoder {
 
         let width = first_frame.width;
         let height = first_frame.height;
+        let pixel_format = first_frame.format;
         let crf = quality.to_crf();
 
         // Try hardware acceleration first, fallback to software if it fails
@@ -218,7 +219,7 @@ impl VideoEncoder {
 
         println!("  Attempting codec: {}", codec_name);
 
-        let mut encoder = match FFmpegEncoder::new(output_path, width, height, fps, &codec_name, crf) {
+        let mut encoder = match FFmpegEncoder::new(output_path, width, height, fps, &codec_name, crf, pixel_format) {
             Ok(enc) => {
                 println!("  ✓ Successfully initialized {} encoder", codec_name);
                 enc
@@ -228,7 +229,7 @@ impl VideoEncoder {
                 println!("  → Falling back to software encoder");
 
                 let software_codec = codec.software_fallback_name();
-                FFmpegEncoder::new(output_path, width, height, fps, software_codec, crf)
+                FFmpegEncoder::new(output_path, width, height, fps, software_codec, crf, pixel_format)
                     .map_err(|e| VideoEncoderError::FFmpeg(format!(
                         "Software fallback also failed: {}", e
                     )))?
@@ -21,7 +21,7 @@ use models::input::{KeyboardEvent, KeyboardStats, MouseEvent};
 use chrono;
 use platform::get_platform;
 use std::collections::hash_map::DefaultHasher;
-use std::collections::HashMap;
+use std::collections::{HashMap, HashSet};
 use std::hash::{Hash, Hasher};
 use std::sync::{Arc, Mutex};
 use tauri::{Manager, State};
@@ -601,11 +601,18 @@ async fn get_timeline_data(
         .await
         .map_err(|e| format!("Failed to get sessions: {}", e))?;
 
+    // Get app usage for every session in one query instead of one per session
+    let session_ids: Vec<&str> = sessions.iter().map(|s| s.id.as_str()).collect();
+    let mut apps_by_session = get_app_usage_for_sessions(&state.db, &session_ids).await?;
+
+    // Likewise check which sessions have recordings with one query per table
+    let screen_recorded = get_sessions_with_screen_recording(&state.db, &session_ids).await?;
+    let input_recorded = get_sessions_with_input_recording(&state.db, &session_ids).await?;
+
     let mut timeline_sessions = Vec::new();
 
     for session in &sessions {
-        // Get app usage for this session
-        let apps = get_app_usage_for_session(&state.db, &session.id).await?;
+        let apps = apps_by_session.remove(&session.id).unwrap_or_default();
 
         // Convert to AppUsageSegments with colors
         let app_segments: Vec<AppUsageSegment> = apps
@@ -624,8 +631,8 @@ async fn get_timeline_data(
         let activity_intensity = calculate_activity_intensity(&app_segments);
 
         // Check for recordings
-        let has_screen_recording = check_has_screen_recording(&state.db, &session.id).await?;
-        let has_input_recording = check_has_input_recording(&state.db, &session.id).await?;
+        let has_screen_recording = screen_recorded.contains(&session.id);
+        let has_input_recording = input_recorded.contains(&session.id);
 
         timeline_sessions.push(TimelineSession {
             id: session.id.clone(),
@@ -659,51 +666,91 @@ async fn get_timeline_data(
 }
 
 // Helper functions for timeline
-async fn get_app_usage_for_session(
+
+/// Max session ids bound per query, well under SQLite's variable limit
+const SESSION_BATCH_SIZE: usize = 500;
+
+/// Fetch app usage for many sessions at once, grouped by session id.
+/// Rows in each group keep start_timestamp order.
+async fn get_app_usage_for_sessions(
     db: &Arc<Database>,
-    session_id: &str,
-) -> Result<Vec<core::os_activity::AppUsage>, String> {
-    sqlx::query_as::<_, core::os_activity::AppUsage>(
-        r#"
-        SELECT id, session_id, app_name, bundle_id, process_id,
-               start_timestamp, end_timestamp, focus_duration_ms, background_duration_ms
-        FROM app_usage
-        WHERE session_id = ?
-        ORDER BY start_timestamp ASC
-        "#
-    )
-    .bind(session_id)
-    .fetch_all(&db.pool)
-    .await
-    .map_err(|e| format!("Failed to get app usage: {}", e))
+    session_ids: &[&str],
+) -> Result<HashMap<String, Vec<core::os_activity::AppUsage>>, String> {
+    let mut grouped: HashMap<String, Vec<core::os_activity::AppUsage>> = HashMap::new();
+
+    for chunk in session_ids.chunks(SESSION_BATCH_SIZE) {
+        let mut builder = sqlx::QueryBuilder::<sqlx::Sqlite>::new(
+            r#"
+            SELECT id, session_id, app_name, bundle_id, process_id,
+                   start_timestamp, end_timestamp, focus_duration_ms, background_duration_ms
+            FROM app_usage
+            WHERE session_id IN ("#,
+        );
+        let mut separated = builder.separated(", ");
+        for id in chunk {
+            separated.push_bind(*id);
+        }
+        separated.push_unseparated(") ORDER BY start_timestamp ASC");
+
+        let rows = builder
+            .build_query_as::<core::os_activity::AppUsage>()
+            .fetch_all(&db.pool)
+            .await
+            .map_err(|e| format!("Failed to get app usage: {}", e))?;
+
+        for app in rows {
+            grouped.entry(app.session_id.clone()).or_default().push(app);
+        }
+    }
+
+    Ok(grouped)
 }
 
-async fn check_has_screen_recording(db: &Arc<Database>, session_id: &str) -> Result<bool, String> {
-    let count: i64 = sqlx::query_scalar(
-        r#"
-        SELECT COUNT(*) FROM screen_recordings WHERE session_id = ?
-        "#,
-    )
-    .bind(session_id)
-    .fetch_one(&db.pool)
-    .await
-    .map_err(|e| format!("Failed to check screen recording: {}", e))?;
+/// Return the subset of `session_ids` that have at least one row in `table`
+async fn get_sessions_with_rows(
+    db: &Arc<Database>,
+    table: &str,
+    session_ids: &[&str],
+) -> Result<HashSet<String>, sqlx::Error> {
+    let mut found = HashSet::new();
+
+    for chunk in session_ids.chunks(SESSION_BATCH_SIZE) {
+        let mut builder = sqlx::QueryBuilder::<sqlx::Sqlite>::new(format!(
+            "SELECT session_id FROM {} WHERE session_id IN (",
+            table
+        ));
+        let mut separated = builder.separated(", ");
+        for id in chunk {
+            separated.push_bind(*id);
+        }
+        separated.push_unseparated(") GROUP BY session_id");
+
+        let rows: Vec<String> = builder
+            .build_query_scalar::<String>()
+            .fetch_all(&db.pool)
+            .await?;
+        found.extend(rows);
+    }
 
-    Ok(count > 0)
+    Ok(found)
 }
 
-async fn check_has_input_recording(db: &Arc<Database>, session_id: &str) -> Result<bool, String> {
-    let count: i64 = sqlx::query_scalar(
-        r#"
-        SELECT COUNT(*) FROM keyboard_events WHERE session_id = ? LIMIT 1
-        "#,
-    )
-    .bind(session_id)
-    .fetch_one(&db.pool)
-    .await
-    .map_err(|e| format!("Failed to check input recording: {}", e))?;
+async fn get_sessions_with_screen_recording(
+    db: &Arc<Database>,
+    session_ids: &[&str],
+) -> Result<HashSet<String>, String> {
+    get_sessions_with_rows(db, "screen_recordings", session_ids)
+        .await
+        .map_err(|e| format!("Failed to check screen recording: {}", e))
+}
 
-    Ok(count > 0)
+async fn get_sessions_with_input_recording(
+    db: &Arc<Database>,
+    session_ids: &[&str],
+) -> Result<HashSet<String>, String> {
+    get_sessions_with_rows(db, "keyboard_events", session_ids)
+        .await
+        .map_err(|e| format!("Failed to check input recording: {}", e))
 }
 
 fn app_color(app_name: &str) -> String {
@@ -2,7 +2,26 @@
 
 use crate::models::capture::{CaptureError, CaptureResult, Display, PixelFormat, RawFrame};
 use std::sync::atomic::{AtomicBool, Ordering};
-use std::sync::Arc;
+use std::sync::{Arc, Mutex};
+
+/// X11 connection kept open across frame captures
+struct X11Connection(*mut x11::xlib::Display);
+
+// The connection is only ever used while holding CAPTURE_CONNECTION's lock
+unsafe impl Send for X11Connection {}
+
+impl Drop for X11Connection {
+    fn drop(&mut self) {
+        unsafe {
+            x11::xlib::XCloseDisplay(self.0);
+        }
+    }
+}
+
+/// Shared capture connection, opened on first capture and closed again by
+/// `close_capture_connection` when recording stops. Reconnecting to the X
+/// server for every frame costs a socket handshake and setup round trips.
+static CAPTURE_CONNECTION: Mutex<Option<X11Connection>> = Mutex::new(None);
 
 /// Display server type
 #[derive(Debug, Clone, Copy, PartialEq, Eq)]
@@ -223,19 +242,27 @@ impl LinuxScreenCapture {
     async fn capture_frame_x11(display_id: u32) -> CaptureResult<RawFrame> {
         let timestamp = chrono::Utc::now().timestamp_millis();
 
+        let mut connection = CAPTURE_CONNECTION
+            .lock()
+            .unwrap_or_else(|poisoned| poisoned.into_inner());
+
         unsafe {
-            // Open X11 display
-            let display = x11::xlib::XOpenDisplay(std::ptr::null());
-            if display.is_null() {
-                return Err(CaptureError::CaptureFailed(
-                    "Failed to open X11 display".to_string()
-                ));
+            // Open X11 display, or reuse the one from the previous frame
+            if connection.is_none() {
+                let display = x11::xlib::XOpenDisplay(std::ptr::null());
+                if display.is_null() {
+                    return Err(CaptureError::CaptureFailed(
+                        "Failed to open X11 display".to_string()
+                    ));
+                }
+                *connection = Some(X11Connection(display));
             }
+            let display = connection.as_ref().unwrap().0;
 
             let screen = x11::xlib::XDefaultScreen(display);
             let root = x11::xlib::XRootWindow(display, screen);
 
-            // Get screen dimensions
+            // Get screen dimensions (every frame, the resolution may change)
             let mut root_return = 0;
             let mut x = 0;
             let mut y = 0;
@@ -273,7 +300,8 @@ impl LinuxScreenCapture {
             );
 
             if image.is_null() {
-                x11::xlib::XCloseDisplay(display);
+                // Drop (and close) the connection so the next frame starts from a fresh one
+                *connection = None;
                 return Err(CaptureError::CaptureFailed(
                     "Failed to capture X11 image".to_string()
                 ));
@@ -284,49 +312,43 @@ impl LinuxScreenCapture {
             let bytes_per_line = (*image).bytes_per_line as usize;
             let image_data = (*image).data;
 
-            // Convert to RGBA format
+            if bytes_per_pixel != 4 && bytes_per_pixel != 3 {
+                // Unsupported format
+                x11::xlib::XDestroyImage(image);
+                return Err(CaptureError::CaptureFailed(
+                    format!("Unsupported pixel format: {} bytes per pixel", bytes_per_pixel)
+                ));
+            }
+
+            // Convert to BGRA format. Rows may be padded to bytes_per_line, so
+            // copy whole rows rather than individual pixels.
             let pixel_count = (width * height) as usize;
+            let row_bytes = width as usize * bytes_per_pixel;
+            let source = std::slice::from_raw_parts(
+                image_data as *const u8,
+                bytes_per_line * height as usize,
+            );
             let mut pixel_data = Vec::with_capacity(pixel_count * 4);
 
-            for row in 0..height {
-                for col in 0..width {
-                    let offset = (row as usize * bytes_per_line) + (col as usize * bytes_per_pixel);
+            if bytes_per_pixel == 4 && bytes_per_line == row_bytes {
+                // X11 typically uses BGRA; unpadded rows copy in one go
+                pixel_data.extend_from_slice(source);
+            } else {
+                for row in source.chunks_exact(bytes_per_line) {
+                    let row = &row[..row_bytes];
 
                     if bytes_per_pixel == 4 {
-                        // BGRA or RGBA format
-                        let b = *image_data.add(offset);
-                        let g = *image_data.add(offset + 1);
-                        let r = *image_data.add(offset + 2);
-                        let a = *image_data.add(offset + 3);
-
-                        // X11 typically uses BGRA
-                        pixel_data.push(b);
-                        pixel_data.push(g);
-                        pixel_data.push(r);
-                        pixel_data.push(a);
-                    } else if bytes_per_pixel == 3 {
-                        // BGR format
-                        let b = *image_data.add(offset);
-                        let g = *image_data.add(offset + 1);
-                        let r = *image_data.add(offset + 2);
-
-                        pixel_data.push(b);
-                        pixel_data.push(g);
-                        pixel_data.push(r);
-                        pixel_data.push(255); // Alpha
+                        pixel_data.extend_from_slice(row);
                     } else {
-                        // Unsupported format
-                        x11::xlib::XDestroyImage(image);
-                        x11::xlib::XCloseDisplay(display);
-                        return Err(CaptureError::CaptureFailed(
-                            format!("Unsupported pixel format: {} bytes per pixel", bytes_per_pixel)
-                        ));
+                        // BGR format
+                        for bgr in row.chunks_exact(3) {
+                            pixel_data.extend_from_slice(&[bgr[0], bgr[1], bgr[2], 255]);
+                        }
                     }
                 }
             }
 
             x11::xlib::XDestroyImage(image);
-            x11::xlib::XCloseDisplay(display);
 
             Ok(RawFrame {
                 timestamp,
@@ -364,6 +386,16 @@ impl LinuxScreenCapture {
         // This requires significant additional dependencies and complexity
     }
 
+    /// Close the X11 connection kept open between frame captures
+    ///
+    /// The next capture opens a new one, so this is safe to call at any time.
+    pub fn close_capture_connection() {
+        CAPTURE_CONNECTION
+            .lock()
+            .unwrap_or_else(|poisoned| poisoned.into_inner())
+            .take();
+    }
+
     /// Start continuous capture from the specified display
     pub async fn start_capture(&mut self, display_id: u32) -> CaptureResult<()> {
         if self.is_capturing.load(Ordering::SeqCst) {
@@ -390,6 +422,7 @@ impl LinuxScreenCapture {
 
         self.is_capturing.store(false, Ordering::SeqCst);
         self.current_display_id = None;
+        Self::close_capture_connection();
 
         Ok(())
     }